@@ -542,9 +542,7 @@ class RemoteAction(Action):
             raise Exception("Failed to execute custom action.")
 
         try:
-            logger.debug(
-                "Calling action endpoint to run action '{}'.".format(self.name())
-            )
+            logger.debug("Calling action endpoint to run action '%s'.", self.name())
             response = await self.action_endpoint.request(
                 json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
             )
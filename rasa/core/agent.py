@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import logging
 import os
 import shutil
@@ -248,15 +250,22 @@ async def load_agent(
             )
 
         elif remote_storage is not None:
-            return Agent.load_from_remote_storage(
-                remote_storage,
-                model_path,
-                interpreter=interpreter,
-                generator=generator,
-                tracker_store=tracker_store,
-                lock_store=lock_store,
-                action_endpoint=action_endpoint,
-                model_server=model_server,
+            # downloading the model from the remote storage is blocking network I/O,
+            # hence we must not run it on the event loop
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                None,
+                functools.partial(
+                    Agent.load_from_remote_storage,
+                    remote_storage,
+                    model_path,
+                    interpreter=interpreter,
+                    generator=generator,
+                    tracker_store=tracker_store,
+                    lock_store=lock_store,
+                    action_endpoint=action_endpoint,
+                    model_server=model_server,
+                ),
             )
 
         elif model_path is not None and os.path.exists(model_path):
@@ -1,9 +1,13 @@
+import asyncio
 import json
 import logging
+import os
+import threading
 import typing
-from typing import Optional, Text, Dict
+from typing import Optional, Text, Dict, List
 
 from rasa.core.brokers.broker import EventBroker
+from rasa.utils.io import DEFAULT_ENCODING
 
 if typing.TYPE_CHECKING:
     from rasa.utils.endpoints import EndpointConfig
@@ -14,13 +18,29 @@ logger = logging.getLogger(__name__)
 class FileEventBroker(EventBroker):
     """Log events to a file in json format.
 
-    There will be one event per line and each event is stored as json."""
+    There will be one event per line and each event is stored as json. Events which
+    are published during the same iteration of the event loop are written to the
+    file at once."""
 
     DEFAULT_LOG_FILE_NAME = "rasa_event.log"
+    # number of characters after which buffered events are written immediately
+    MAX_BUFFER_SIZE = 64 * 1024
 
     def __init__(self, path: Optional[Text] = None) -> None:
         self.path = path or self.DEFAULT_LOG_FILE_NAME
-        self.event_logger = self._event_logger()
+
+        self._buffer: List[Text] = []
+        self._buffer_size = 0
+        # event loop which is going to write the buffered events
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        # guards the buffer and the writes to the file, so that batches of events
+        # which are flushed concurrently are written in the order they were buffered
+        self._buffer_lock = threading.Lock()
+
+        self._file_descriptor: Optional[int] = self._open_log_file()
+
+    def __del__(self) -> None:
+        self.close()
 
     @classmethod
     def from_endpoint_config(
@@ -32,24 +52,93 @@ class FileEventBroker(EventBroker):
         # noinspection PyArgumentList
         return cls(**broker_config.kwargs)
 
-    def _event_logger(self) -> logging.Logger:
-        """Instantiate the file logger."""
+    def _open_log_file(self) -> int:
+        """Open the log file in append mode.
+
+        Writes to a file which was opened with `O_APPEND` are appended atomically, so
+        the lines of processes which write to the same file don't interleave.
+        """
+
+        file_descriptor = os.open(
+            self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        logger.info(f"Logging events to '{self.path}'.")
 
-        logger_file = self.path
-        # noinspection PyTypeChecker
-        query_logger = logging.getLogger("event-logger")
-        query_logger.setLevel(logging.INFO)
-        handler = logging.FileHandler(logger_file)
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        query_logger.propagate = False
-        query_logger.addHandler(handler)
+        return file_descriptor
 
-        logger.info(f"Logging events to '{logger_file}'.")
+    def _close_log_file(self) -> None:
+        file_descriptor = getattr(self, "_file_descriptor", None)
+        if file_descriptor is not None:
+            self._file_descriptor = None
+            os.close(file_descriptor)
 
-        return query_logger
+    def _write(self, data: bytes) -> None:
+        if self._file_descriptor is None:
+            self._file_descriptor = self._open_log_file()
+
+        written = os.write(self._file_descriptor, data)
+        # a single write might be partial, e.g. if the disk is full
+        while written < len(data):
+            data = data[written:]
+            written = os.write(self._file_descriptor, data)
 
     def publish(self, event: Dict) -> None:
-        """Write event to file."""
+        """Write event to file.
+
+        If the event loop is running, the event is buffered and written together with
+        the other events published in the same loop iteration. Otherwise it is
+        written right away.
+        """
+
+        serialized = json.dumps(event)
+
+        with self._buffer_lock:
+            self._buffer.append(serialized)
+            self._buffer_size += len(serialized)
+
+            if self._buffer_size < self.MAX_BUFFER_SIZE and self._schedule_flush():
+                return
+
+        self.flush()
+
+    def _schedule_flush(self) -> bool:
+        """Schedule writing the buffered events once the event loop is idle again.
+
+        Returns:
+            `True` if the events will be written by the event loop, `False` if there
+            is no running event loop in the current thread.
+        """
+
+        # `asyncio.get_event_loop()` would create a new event loop if there is none
+        # yet. `get_running_loop()` is only available as of Python 3.7.
+        loop = asyncio._get_running_loop()
+        if loop is None:
+            # write the events right away, even if a flush was scheduled on an event
+            # loop which might have been stopped in the meantime
+            return False
+
+        # a flush which was scheduled on another event loop might never run
+        if self._flush_loop is not loop:
+            loop.call_soon(self.flush)
+            self._flush_loop = loop
+
+        return True
+
+    def flush(self) -> None:
+        """Write all buffered events to the file."""
+
+        with self._buffer_lock:
+            events = self._buffer
+            self._buffer = []
+            self._buffer_size = 0
+            self._flush_loop = None
+
+            if events:
+                data = "".join(e + "\n" for e in events).encode(DEFAULT_ENCODING)
+                self._write(data)
+
+    def close(self) -> None:
+        """Write all events which are still buffered to the file and close it."""
 
-        self.event_logger.info(json.dumps(event))
-        self.event_logger.handlers[0].flush()
+        self.flush()
+        self._close_log_file()
@@ -4,8 +4,9 @@ import os
 import time
 import typing
 from collections import deque
-from threading import Thread
-from typing import Callable, Deque, Dict, Optional, Text, Union, Any
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from threading import Lock, Thread, current_thread
+from typing import Callable, Deque, Dict, Optional, Text, Tuple, Union, Any
 
 from rasa.constants import (
     DEFAULT_LOG_LEVEL_LIBRARIES,
@@ -221,6 +222,9 @@ def close_pika_connection(connection: "Connection") -> None:
 
 
 class PikaEventBroker(EventBroker):
+    # seconds to wait for the Pika io loop thread to publish a message
+    PUBLISH_TIMEOUT_IN_SECONDS = 10
+
     def __init__(
         self,
         host: Text,
@@ -263,6 +267,13 @@ class PikaEventBroker(EventBroker):
 
         # List to store unpublished messages which hopefully will be published later
         self._unpublished_messages: Deque[Text] = deque()
+        # Messages which are waiting to be published by the Pika io loop thread
+        self._messages_to_publish: Deque[
+            Tuple[Text, Optional[Dict[Text, Text]], Optional[Future]]
+        ] = deque()
+        self._is_publishing_scheduled = False
+        self._publishing_lock = Lock()
+        self._pika_io_loop_thread: Optional[Thread] = None
         self._run_pika()
 
     def __del__(self) -> None:
@@ -271,7 +282,8 @@ class PikaEventBroker(EventBroker):
             close_pika_connection(self.channel.connection)
 
     def close(self) -> None:
-        """Close the pika channel and connection."""
+        """Publish the remaining messages and close the pika channel and connection."""
+        self._wait_for_scheduled_messages()
         self.__del__()
 
     @property
@@ -291,6 +303,9 @@ class PikaEventBroker(EventBroker):
         parameters = _get_pika_parameters(
             self.host, self.username, self.password, self.port
         )
+        with self._publishing_lock:
+            # callbacks of a previous io loop are not going to run anymore
+            self._is_publishing_scheduled = False
         self._pika_connection = initialise_pika_select_connection(
             parameters, self._on_open_connection, self._on_open_connection_error
         )
@@ -323,8 +338,12 @@ class PikaEventBroker(EventBroker):
 
     def _run_pika_io_loop_in_thread(self) -> None:
         thread = Thread(target=self._run_pika_io_loop, daemon=True)
+        self._pika_io_loop_thread = thread
         thread.start()
 
+    def _is_pika_io_loop_thread(self) -> bool:
+        return current_thread() is self._pika_io_loop_thread
+
     def _run_pika_io_loop(self) -> None:
         # noinspection PyUnresolvedReferences
         self._pika_connection.ioloop.start()
@@ -382,7 +401,9 @@ class PikaEventBroker(EventBroker):
                     "Could not open Pika channel at host '{}'. Failed with error: "
                     "{}".format(self.host, e)
                 )
-                self.channel = None
+                if not isinstance(e, FutureTimeoutError):
+                    # the channel is still open if the io loop was just too slow
+                    self.channel = None
                 if self.raise_on_failure:
                     raise e
 
@@ -431,6 +452,124 @@ class PikaEventBroker(EventBroker):
     def _basic_publish(
         self, body: Text, headers: Optional[Dict[Text, Text]] = None
     ) -> None:
+        """Hand the message over to the Pika io loop thread.
+
+        Pika channels are not thread-safe, hence the message is published by the
+        thread running the io loop. Messages which are queued while the io loop is
+        busy are sent together, so that the io loop is only woken up once.
+
+        The message is published in the background, unless `raise_on_failure` is
+        set (e.g. by `rasa export`). Then this waits until the message was
+        published, so that errors are raised to the caller.
+        """
+        if self._is_pika_io_loop_thread():
+            # e.g. when publishing unpublished messages once the channel is open
+            self._publish_to_channel(body, headers)
+            return
+
+        published = Future() if self.raise_on_failure else None
+        self._messages_to_publish.append((body, headers, published))
+        self._schedule_publishing()
+
+        if published is not None:
+            self._wait_until_published(published)
+
+    def _wait_until_published(self, published: Future) -> None:
+        try:
+            published.result(timeout=self.PUBLISH_TIMEOUT_IN_SECONDS)
+            return
+        except FutureTimeoutError:
+            if published.cancel():
+                with self._publishing_lock:
+                    # the io loop might not be running anymore, make sure the next
+                    # message schedules publishing again
+                    self._is_publishing_scheduled = False
+                raise
+
+        # the io loop thread is publishing the message already, so it must not be
+        # retried
+        published.result()
+
+    def _schedule_publishing(self) -> None:
+        with self._publishing_lock:
+            if self._is_publishing_scheduled:
+                return
+            self._is_publishing_scheduled = True
+
+        # noinspection PyUnresolvedReferences
+        self._pika_connection.ioloop.add_callback_threadsafe(
+            self._publish_scheduled_messages
+        )
+
+    def _publish_scheduled_messages(self) -> None:
+        with self._publishing_lock:
+            self._is_publishing_scheduled = False
+
+        while self._messages_to_publish:
+            body, headers, published = self._messages_to_publish.popleft()
+            if published is not None and not published.set_running_or_notify_cancel():
+                # the caller stopped waiting for the message to be published
+                continue
+
+            # errors must not be raised here, as they would stop the io loop
+            try:
+                self._publish_to_channel(body, headers)
+            except Exception as e:
+                if published is not None:
+                    published.set_exception(e)
+                else:
+                    self._handle_failed_publishing(body, e)
+            else:
+                if published is not None:
+                    published.set_result(None)
+
+    def _handle_failed_publishing(self, body: Text, error: Exception) -> None:
+        if self.should_keep_unpublished_messages:
+            logger.warning(
+                f"Could not publish Pika event to queue '{self.queue}' on host "
+                f"'{self.host}'. Failed with error: {error}. Adding message to list "
+                f"of unpublished messages and trying to publish it once the "
+                f"channel was opened again."
+            )
+            self._unpublished_messages.append(body)
+        else:
+            logger.error(
+                f"Failed to publish Pika event to queue '{self.queue}' on host "
+                f"'{self.host}'. Failed with error: {error}:\n{body}"
+            )
+
+    def _wait_for_scheduled_messages(self) -> None:
+        """Wait until the io loop thread published all scheduled messages."""
+
+        if not self._messages_to_publish or self._is_pika_io_loop_thread():
+            return
+
+        published = Future()
+
+        def publish_scheduled_messages() -> None:
+            self._publish_scheduled_messages()
+            published.set_result(None)
+
+        # noinspection PyUnresolvedReferences
+        self._pika_connection.ioloop.add_callback_threadsafe(publish_scheduled_messages)
+
+        try:
+            published.result(timeout=self.PUBLISH_TIMEOUT_IN_SECONDS)
+        except FutureTimeoutError:
+            logger.warning(
+                f"Failed to publish {len(self._messages_to_publish)} Pika events to "
+                f"queue '{self.queue}' on host '{self.host}' before closing the "
+                f"connection."
+            )
+
+    def _publish_to_channel(
+        self, body: Text, headers: Optional[Dict[Text, Text]] = None
+    ) -> None:
+        if not self.channel and self.should_keep_unpublished_messages:
+            # the connection was reset and the new channel isn't open yet
+            self._unpublished_messages.append(body)
+            return
+
         self.channel.basic_publish(
             "",
             self.queue,
@@ -439,8 +578,10 @@ class PikaEventBroker(EventBroker):
         )
 
         logger.debug(
-            f"Published Pika events to queue '{self.queue}' on host "
-            f"'{self.host}':\n{body}"
+            "Published Pika events to queue '%s' on host '%s':\n%s",
+            self.queue,
+            self.host,
+            body,
         )
 
     def _publish(self, body: Text, headers: Optional[Dict[Text, Text]] = None) -> None:
@@ -5,6 +5,7 @@ import logging
 import re
 
 import os
+import typing
 from typing import Text, List, Dict, Any, Union, Optional, Tuple
 
 from rasa.constants import DOCS_URL_STORIES
@@ -14,8 +15,26 @@ from rasa.core.constants import INTENT_MESSAGE_PREFIX
 from rasa.utils.common import raise_warning, class_from_module_path
 from rasa.utils.endpoints import EndpointConfig
 
+if typing.TYPE_CHECKING:
+    from rasa.nlu.components import ComponentBuilder
+
 logger = logging.getLogger(__name__)
 
+# builder shared by all `RasaNLUInterpreter`s, so that cacheable components (e.g.
+# language models) are reused when a model is reloaded or a new one is loaded
+_component_builder: Optional["ComponentBuilder"] = None
+
+
+def _get_component_builder() -> "ComponentBuilder":
+    global _component_builder
+
+    if _component_builder is None:
+        from rasa.nlu.components import ComponentBuilder
+
+        _component_builder = ComponentBuilder()
+
+    return _component_builder
+
 
 class NaturalLanguageInterpreter:
     async def parse(
@@ -294,7 +313,9 @@ class RasaNLUInterpreter(NaturalLanguageInterpreter):
     def _load_interpreter(self) -> None:
         from rasa.nlu.model import Interpreter
 
-        self.interpreter = Interpreter.load(self.model_directory)
+        self.interpreter = Interpreter.load(
+            self.model_directory, _get_component_builder()
+        )
 
 
 def _create_from_endpoint_config(
@@ -159,9 +159,8 @@ class FallbackPolicy(Policy):
             # the fallback action will be executed.
             logger.debug(
                 "NLU confidence threshold met, confidence of "
-                "fallback action set to core threshold ({}).".format(
-                    self.core_threshold
-                )
+                "fallback action set to core threshold (%s).",
+                self.core_threshold,
             )
             result = self.fallback_scores(domain, self.core_threshold)
 
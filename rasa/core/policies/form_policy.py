@@ -143,9 +143,7 @@ class FormPolicy(MemoizationPolicy):
         result = self._default_predictions(domain)
 
         if tracker.active_form.get("name"):
-            logger.debug(
-                "There is an active form '{}'".format(tracker.active_form["name"])
-            )
+            logger.debug("There is an active form '%s'", tracker.active_form["name"])
             if tracker.latest_action_name == ACTION_LISTEN_NAME:
                 # predict form action after user utterance
 
@@ -151,8 +151,7 @@ class MappingPolicy(Policy):
             logger.debug("Restarting the conversation with action_restart.")
         else:
             logger.debug(
-                "There is no mapped action for the predicted intent, "
-                "'{}'.".format(intent)
+                "There is no mapped action for the predicted intent, '%s'.", intent
             )
         return prediction
 
@@ -126,26 +126,28 @@ class TwoStageFallbackPolicy(FallbackPolicy):
         if self._is_user_input_expected(tracker):
             result = confidence_scores_for(ACTION_LISTEN_NAME, 1.0, domain)
         elif self._has_user_denied(last_intent_name, tracker):
-            logger.debug(f"User '{tracker.sender_id}' denied suggested intents.")
+            logger.debug("User '%s' denied suggested intents.", tracker.sender_id)
             result = self._results_for_user_denied(tracker, domain)
         elif user_rephrased and should_nlu_fallback:
             logger.debug(
-                "Ambiguous rephrasing of user '{}' "
-                "for intent '{}'".format(tracker.sender_id, last_intent_name)
+                "Ambiguous rephrasing of user '%s' for intent '%s'",
+                tracker.sender_id,
+                last_intent_name,
             )
             result = confidence_scores_for(
                 ACTION_DEFAULT_ASK_AFFIRMATION_NAME, 1.0, domain
             )
         elif user_rephrased:
-            logger.debug(f"User '{tracker.sender_id}' rephrased intent")
+            logger.debug("User '%s' rephrased intent", tracker.sender_id)
             result = confidence_scores_for(
                 ACTION_REVERT_FALLBACK_EVENTS_NAME, 1.0, domain
             )
         elif tracker.last_executed_action_has(ACTION_DEFAULT_ASK_AFFIRMATION_NAME):
             if not should_nlu_fallback:
                 logger.debug(
-                    "User '{}' affirmed intent '{}'"
-                    "".format(tracker.sender_id, last_intent_name)
+                    "User '%s' affirmed intent '%s'",
+                    tracker.sender_id,
+                    last_intent_name,
                 )
                 result = confidence_scores_for(
                     ACTION_REVERT_FALLBACK_EVENTS_NAME, 1.0, domain
@@ -156,9 +158,9 @@ class TwoStageFallbackPolicy(FallbackPolicy):
                 )
         elif should_nlu_fallback:
             logger.debug(
-                "User '{}' has to affirm intent '{}'.".format(
-                    tracker.sender_id, last_intent_name
-                )
+                "User '%s' has to affirm intent '%s'.",
+                tracker.sender_id,
+                last_intent_name,
             )
             result = confidence_scores_for(
                 ACTION_DEFAULT_ASK_AFFIRMATION_NAME, 1.0, domain
@@ -166,9 +168,8 @@ class TwoStageFallbackPolicy(FallbackPolicy):
         else:
             logger.debug(
                 "NLU confidence threshold met, confidence of "
-                "fallback action set to core threshold ({}).".format(
-                    self.core_threshold
-                )
+                "fallback action set to core threshold (%s).",
+                self.core_threshold,
             )
             result = self.fallback_scores(domain, self.core_threshold)
 
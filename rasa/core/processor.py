@@ -164,7 +164,7 @@ class MessageProcessor:
         """
         if not tracker.applied_events() or self._has_session_expired(tracker):
             logger.debug(
-                f"Starting a new session for conversation ID '{tracker.sender_id}'."
+                "Starting a new session for conversation ID '%s'.", tracker.sender_id
             )
 
             await self._run_action(
@@ -272,8 +272,9 @@ class MessageProcessor:
             max_confidence_index, self.action_endpoint
         )
         logger.debug(
-            f"Predicted next action '{action.name()}' with confidence "
-            f"{action_confidences[max_confidence_index]:.2f}."
+            "Predicted next action '%s' with confidence %.2f.",
+            action.name(),
+            action_confidences[max_confidence_index],
         )
         return action, policy, action_confidences[max_confidence_index]
 
@@ -379,6 +380,9 @@ class MessageProcessor:
     @staticmethod
     def _log_slots(tracker) -> None:
         # Log currently set slots
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
         slot_values = "\n".join(
             [f"\t{s.name}: {s.value}" for s in tracker.slots.values()]
         )
@@ -389,12 +393,13 @@ class MessageProcessor:
         """Check if the NLU interpreter picks up intents or entities that aren't
         recognized."""
 
-        domain_is_not_empty = self.domain and not self.domain.is_empty()
-
+        # checking whether the domain is empty is expensive, hence this is only done
+        # if there is an unseen intent or entity which we would otherwise warn about
         intent = parse_data["intent"]["name"]
         if intent:
+            # a domain which contains the intent can't be empty
             intent_is_recognized = (
-                domain_is_not_empty and intent in self.domain.intents
+                self.domain and intent in self.domain.intents
             ) or intent in DEFAULT_INTENTS
             if not intent_is_recognized:
                 raise_warning(
@@ -407,7 +412,12 @@ class MessageProcessor:
         entities = parse_data["entities"] or []
         for element in entities:
             entity = element["entity"]
-            if entity and domain_is_not_empty and entity not in self.domain.entities:
+            if (
+                entity
+                and self.domain
+                and entity not in self.domain.entities
+                and not self.domain.is_empty()
+            ):
                 raise_warning(
                     f"Interpreter parsed an entity '{entity}' "
                     f"which is not defined in the domain. "
@@ -432,10 +442,10 @@ class MessageProcessor:
             )
 
         logger.debug(
-            "Received user message '{}' with intent '{}' "
-            "and entities '{}'".format(
-                message.text, parse_data["intent"], parse_data["entities"]
-            )
+            "Received user message '%s' with intent '%s' and entities '%s'",
+            message.text,
+            parse_data["intent"],
+            parse_data["entities"],
         )
 
         self._log_unseen_features(parse_data)
@@ -470,7 +480,7 @@ class MessageProcessor:
             self._log_slots(tracker)
 
         logger.debug(
-            f"Logged UserUtterance - tracker now has {len(tracker.events)} events."
+            "Logged UserUtterance - tracker now has %d events.", len(tracker.events)
         )
 
     @staticmethod
@@ -659,9 +669,7 @@ class MessageProcessor:
         if events is None:
             events = []
 
-        logger.debug(
-            f"Action '{action_name}' ended with events '{[e for e in events]}'."
-        )
+        logger.debug("Action '%s' ended with events '%s'.", action_name, events)
 
         self._warn_about_new_slots(tracker, action_name, events)
 
@@ -201,6 +201,13 @@ def serve_application(
 
     app.register_listener(clear_model_files, "after_server_stop")
 
+    # noinspection PyUnresolvedReferences
+    async def close_event_broker(_app: Sanic, _loop: Text) -> None:
+        if _app.agent and _app.agent.tracker_store.event_broker:
+            _app.agent.tracker_store.event_broker.close()
+
+    app.register_listener(close_event_broker, "after_server_stop")
+
     rasa.utils.common.update_sanic_log_level(log_file)
 
     app.run(
@@ -29,6 +29,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# maximum number of story files which are read at the same time
+MAX_CONCURRENTLY_READ_STORY_FILES = 8
+
 
 class EndToEndReader(MarkdownReader):
     def __init__(self) -> None:
@@ -219,13 +222,20 @@ class StoryFileReader:
         use_e2e: bool = False,
         exclusion_percentage: Optional[int] = None,
     ) -> List[StoryStep]:
-        story_steps = []
+        # the files are read concurrently, as parsing end-to-end stories might
+        # have to wait for the (possibly remote) interpreter. The number of files
+        # which are read at the same time is limited to not flood the interpreter
+        # with requests.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENTLY_READ_STORY_FILES)
+
+        async def read_from_file(filename: Text) -> List[StoryStep]:
+            async with semaphore:
+                return await StoryFileReader.read_from_file(
+                    filename, domain, interpreter, template_variables, use_e2e
+                )
 
-        for f in files:
-            steps = await StoryFileReader.read_from_file(
-                f, domain, interpreter, template_variables, use_e2e
-            )
-            story_steps.extend(steps)
+        story_steps_per_file = await asyncio.gather(*[read_from_file(f) for f in files])
+        story_steps = [step for steps in story_steps_per_file for step in steps]
 
         # if exclusion percentage is not 100
         if exclusion_percentage and exclusion_percentage != 100:
@@ -1,9 +1,12 @@
+import copy
 import glob
 import logging
 import os
 import shutil
+import stat
 import tempfile
 import typing
+from functools import lru_cache
 from pathlib import Path
 from typing import Text, Tuple, Union, Optional, List, Dict, NamedTuple
 
@@ -337,11 +340,37 @@ def fingerprint_from_path(model_path: Text) -> Fingerprint:
 
     fingerprint_path = os.path.join(model_path, FINGERPRINT_FILE_PATH)
 
-    if os.path.isfile(fingerprint_path):
-        return rasa.utils.io.read_json_file(fingerprint_path)
-    else:
+    try:
+        file_stats = os.stat(fingerprint_path)
+    except OSError:
+        return {}
+
+    if not stat.S_ISREG(file_stats.st_mode):
         return {}
 
+    # The file is only read again if it changed since it was read the last time.
+    # Note that a rewrite of the file which keeps its size isn't detected on file
+    # systems whose modification times are too coarse to tell the writes apart.
+    # Fingerprints are written once when a model is packaged, so this is not an
+    # issue in practice.
+    fingerprint = _read_fingerprint(
+        fingerprint_path, file_stats.st_ino, file_stats.st_size, file_stats.st_mtime_ns
+    )
+    # the fingerprint contains lists which callers must not change in the cache
+    return copy.deepcopy(fingerprint)
+
+
+@lru_cache(maxsize=16)
+def _read_fingerprint(
+    fingerprint_path: Text, _inode: int, _size: int, _modification_time: int
+) -> Fingerprint:
+    """Read a fingerprint file.
+
+    The file stats are only passed to invalidate the cache when the file changes.
+    """
+
+    return rasa.utils.io.read_json_file(fingerprint_path)
+
 
 def persist_fingerprint(output_path: Text, fingerprint: Fingerprint):
     """Persist a model fingerprint.
@@ -1,5 +1,7 @@
 import logging
+import threading
 import typing
+from collections import OrderedDict
 from typing import Any, Dict, Hashable, List, Optional, Set, Text, Tuple, Type
 
 from rasa.constants import DOCS_URL_MIGRATION_GUIDE
@@ -43,13 +45,15 @@ def validate_requirements(component_names: List[Text]) -> None:
 
     from rasa.nlu import registry
 
-    # Validate that all required packages are installed
-    failed_imports = set()
-    for component_name in component_names:
+    # Validate that all required packages are installed. Pipelines often contain
+    # several components which require the same packages (e.g. `spacy`), hence
+    # every component and every package is only checked once.
+    required_packages = set()
+    for component_name in set(component_names):
         component_class = registry.get_component_class(component_name)
-        failed_imports.update(
-            find_unavailable_packages(component_class.required_packages())
-        )
+        required_packages.update(component_class.required_packages())
+
+    failed_imports = find_unavailable_packages(list(required_packages))
     if failed_imports:  # pragma: no cover
         # if available, use the development file to figure out the correct
         # version numbers for each requirement
@@ -571,11 +575,16 @@ class ComponentBuilder:
     Caches components for reuse.
     """
 
-    def __init__(self, use_cache: bool = True) -> None:
+    def __init__(self, use_cache: bool = True, max_cache_size: int = 8) -> None:
         self.use_cache = use_cache
         # Reuse nlp and featurizers where possible to save memory,
-        # every component that implements a cache-key will be cached
-        self.component_cache = {}
+        # every component that implements a cache-key will be cached.
+        # Once more than `max_cache_size` components are cached, the least
+        # recently used one is removed from the cache.
+        self.max_cache_size = max_cache_size
+        self.component_cache = OrderedDict()
+        # the builder might be shared by models which are loaded in different threads
+        self._cache_lock = threading.Lock()
 
     def __get_cached_component(
         self, component_meta: Dict[Text, Any], model_metadata: "Metadata"
@@ -591,24 +600,32 @@ class ComponentBuilder:
         component_name = component_meta.get("class", component_meta["name"])
         component_class = registry.get_component_class(component_name)
         cache_key = component_class.cache_key(component_meta, model_metadata)
-        if (
-            cache_key is not None
-            and self.use_cache
-            and cache_key in self.component_cache
-        ):
-            return self.component_cache[cache_key], cache_key
-        else:
+        if cache_key is None or not self.use_cache:
             return None, cache_key
 
+        with self._cache_lock:
+            component = self.component_cache.get(cache_key)
+            if component is not None:
+                self.component_cache.move_to_end(cache_key)
+
+        return component, cache_key
+
     def __add_to_cache(self, component: Component, cache_key: Optional[Text]) -> None:
         """Add a component to the cache."""
 
-        if cache_key is not None and self.use_cache:
+        if cache_key is None or not self.use_cache:
+            return
+
+        with self._cache_lock:
             self.component_cache[cache_key] = component
             logger.info(
                 f"Added '{component.name}' to component cache. Key '{cache_key}'."
             )
 
+            if len(self.component_cache) > self.max_cache_size:
+                evicted_key, _ = self.component_cache.popitem(last=False)
+                logger.info(f"Removed key '{evicted_key}' from component cache.")
+
     def load_component(
         self,
         component_meta: Dict[Text, Any],
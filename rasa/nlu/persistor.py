@@ -3,26 +3,67 @@ import logging
 import os
 import shutil
 import tarfile
-from typing import List, Optional, Text, Tuple
+import threading
+from typing import Dict, List, Optional, Text, Tuple
 
 
 logger = logging.getLogger(__name__)
 
+# Creating a persistor sets up a client for the cloud storage and checks whether
+# the bucket exists, which both require requests to the storage. Persistors are
+# hence reused. The clients of e.g. `boto3` must not be shared between threads,
+# so every thread has its own persistors.
+_persistors = threading.local()
+
+# Environment variables which configure the clients of the cloud storages. A
+# persistor is only reused as long as they don't change.
+_CLIENT_ENVIRONMENT_VARIABLES = {
+    "aws": (
+        "AWS_ACCESS_KEY_ID",
+        "AWS_SECRET_ACCESS_KEY",
+        "AWS_SESSION_TOKEN",
+        "AWS_DEFAULT_REGION",
+        "AWS_PROFILE",
+    ),
+    "gcs": ("GOOGLE_APPLICATION_CREDENTIALS", "GOOGLE_CLOUD_PROJECT"),
+    "azure": (),
+}
+
 
 def get_persistor(name: Text) -> Optional["Persistor"]:
     """Returns an instance of the requested persistor.
 
     Currently, `aws`, `gcs` and `azure` are supported"""
 
+    settings = _persistor_settings(name)
+    if settings is None:
+        return None
+
+    if not hasattr(_persistors, "cache"):
+        _persistors.cache = {}
+    cache: Dict[Tuple, "Persistor"] = _persistors.cache
+
+    key = (
+        (name,)
+        + settings
+        + tuple(os.environ.get(v) for v in _CLIENT_ENVIRONMENT_VARIABLES[name])
+    )
+    if key not in cache:
+        cache[key] = _create_persistor(name, settings)
+
+    return cache[key]
+
+
+def _persistor_settings(name: Text) -> Optional[Tuple[Optional[Text], ...]]:
+    """Returns the settings of the requested persistor from the environment."""
+
     if name == "aws":
-        return AWSPersistor(
-            os.environ.get("BUCKET_NAME"), os.environ.get("AWS_ENDPOINT_URL")
-        )
+        return os.environ.get("BUCKET_NAME"), os.environ.get("AWS_ENDPOINT_URL")
     if name == "gcs":
-        return GCSPersistor(os.environ.get("BUCKET_NAME"))
+        return (os.environ.get("BUCKET_NAME"),)
 
     if name == "azure":
-        return AzurePersistor(
+        return (
             os.environ.get("AZURE_CONTAINER"),
             os.environ.get("AZURE_ACCOUNT_NAME"),
             os.environ.get("AZURE_ACCOUNT_KEY"),
@@ -31,6 +72,15 @@ def get_persistor(name: Text) -> Optional["Persistor"]:
     return None
 
 
+def _create_persistor(name: Text, settings: Tuple[Optional[Text], ...]) -> "Persistor":
+    if name == "aws":
+        return AWSPersistor(*settings)
+    if name == "gcs":
+        return GCSPersistor(*settings)
+
+    return AzurePersistor(*settings)
+
+
 class Persistor:
     """Store models in cloud and fetch them when needed"""
 
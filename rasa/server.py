@@ -1,14 +1,17 @@
 import asyncio
 import functools
+import importlib
 import logging
 import multiprocessing
 import os
+import sys
 import tempfile
 import traceback
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce, wraps
 from inspect import isawaitable
-from typing import Any, Callable, List, Optional, Text, Union
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Type, Union
 
 import rasa
 import rasa.core.utils
@@ -54,6 +57,14 @@ logger = logging.getLogger(__name__)
 OUTPUT_CHANNEL_QUERY_KEY = "output_channel"
 USE_LATEST_INPUT_CHANNEL_AS_OUTPUT_CHANNEL = "latest"
 
+# Emulators by `emulation_mode`. They are given as module and class name, so they
+# are only imported if used. Once imported, the entry is replaced with the class.
+_EMULATORS: Dict[Text, Union[Tuple[Text, Text], Type[NoEmulator]]] = {
+    "wit": ("rasa.nlu.emulators.wit", "WitEmulator"),
+    "luis": ("rasa.nlu.emulators.luis", "LUISEmulator"),
+    "dialogflow": ("rasa.nlu.emulators.dialogflow", "DialogflowEmulator"),
+}
+
 
 class ErrorResponse(Exception):
     def __init__(
@@ -276,19 +287,10 @@ def _create_emulator(mode: Optional[Text]) -> NoEmulator:
 
     if mode is None:
         return NoEmulator()
-    elif mode.lower() == "wit":
-        from rasa.nlu.emulators.wit import WitEmulator
-
-        return WitEmulator()
-    elif mode.lower() == "luis":
-        from rasa.nlu.emulators.luis import LUISEmulator
 
-        return LUISEmulator()
-    elif mode.lower() == "dialogflow":
-        from rasa.nlu.emulators.dialogflow import DialogflowEmulator
-
-        return DialogflowEmulator()
-    else:
+    mode = mode.lower()
+    emulator = _EMULATORS.get(mode)
+    if emulator is None:
         raise ErrorResponse(
             400,
             "BadRequest",
@@ -297,6 +299,56 @@ def _create_emulator(mode: Optional[Text]) -> NoEmulator:
             {"parameter": "emulation_mode", "in": "query"},
         )
 
+    if isinstance(emulator, tuple):
+        module_name, class_name = emulator
+        emulator = getattr(importlib.import_module(module_name), class_name)
+        _EMULATORS[mode] = emulator
+
+    return emulator()
+
+
+def _get_job_executor(app: Sanic) -> ThreadPoolExecutor:
+    """Return the executor which runs training and evaluation jobs.
+
+    Jobs used to run in the default executor of the event loop (or even on the event
+    loop itself), which is shared with e.g. the DNS lookups of `aiohttp`. Having a
+    separate executor avoids long running jobs blocking these. The executor is only
+    created once the first job is submitted and spawns its threads on demand.
+    """
+
+    if app.job_executor is None:
+        app.job_executor = ThreadPoolExecutor(thread_name_prefix="rasa-job")
+
+    return app.job_executor
+
+
+def _shutdown_job_executor(app: Sanic) -> None:
+    """Shut down the job executor without waiting for running jobs to finish.
+
+    Jobs which didn't start yet are cancelled (requires Python 3.9 or newer).
+    """
+
+    if app.job_executor is None:
+        return
+
+    if sys.version_info >= (3, 9):
+        # pytype: disable=wrong-keyword-args
+        app.job_executor.shutdown(wait=False, cancel_futures=True)
+        # pytype: enable=wrong-keyword-args
+    else:
+        app.job_executor.shutdown(wait=False)
+
+    app.job_executor = None
+
+
+async def _run_job(app: Sanic, job: Callable[..., Any], **kwargs: Any) -> Any:
+    """Run a blocking job (e.g. a training) without blocking the event loop."""
+
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        _get_job_executor(app), functools.partial(job, **kwargs)
+    )
+
 
 async def _load_agent(
     model_path: Optional[Text] = None,
@@ -400,6 +452,13 @@ def create_app(
     # Initialize shared object of type unsigned int for tracking
     # the number of active training processes
     app.active_training_processes = multiprocessing.Value("I", 0)
+    # executor for training and evaluation jobs, see `_get_job_executor`
+    app.job_executor = None
+
+    # noinspection PyUnusedLocal
+    @app.listener("after_server_stop")
+    async def shutdown_job_executor(running_app: Sanic, loop: Any) -> None:
+        _shutdown_job_executor(running_app)
 
     @app.exception(ErrorResponse)
     async def handle_error_response(request: Request, exception: ErrorResponse):
@@ -788,16 +847,11 @@ def create_app(
                 force_training=rjs.get("force", False),
             )
 
-            loop = asyncio.get_event_loop()
-
             from rasa import train as train_model
 
             # Declare `model_path` upfront to avoid pytype `name-error`
             model_path: Optional[Text] = None
-            # pass `None` to run in default executor
-            model_path = await loop.run_in_executor(
-                None, functools.partial(train_model, **info)
-            )
+            model_path = await _run_job(app, train_model, **info)
 
             filename = os.path.basename(model_path) if model_path else None
 
@@ -904,7 +958,9 @@ def create_app(
         _, nlu_model = model.get_model_subdirectories(model_directory)
 
         try:
-            evaluation = run_evaluation(data_path, nlu_model)
+            evaluation = await _run_job(
+                app, run_evaluation, data_path=data_path, model_path=nlu_model
+            )
             return response.json(evaluation)
         except Exception as e:
             logger.debug(traceback.format_exc())
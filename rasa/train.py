@@ -8,7 +8,7 @@ from rasa.importers.importer import TrainingDataImporter
 from rasa import model
 from rasa.model import FingerprintComparisonResult
 from rasa.core.domain import Domain
-from rasa.utils.common import TempDirectoryPath
+from rasa.utils.common import TempDirectoryPath, run_in_loop
 
 from rasa.cli.utils import (
     print_success,
@@ -31,14 +31,7 @@ def train(
     additional_arguments: Optional[Dict] = None,
     loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> Optional[Text]:
-    if loop is None:
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-    return loop.run_until_complete(
+    return run_in_loop(
         train_async(
             domain=domain,
             config=config,
@@ -48,7 +41,8 @@ def train(
             fixed_model_name=fixed_model_name,
             persist_nlu_training_data=persist_nlu_training_data,
             additional_arguments=additional_arguments,
-        )
+        ),
+        loop,
     )
 
 
@@ -260,8 +254,7 @@ def train_core(
     fixed_model_name: Optional[Text] = None,
     additional_arguments: Optional[Dict] = None,
 ) -> Optional[Text]:
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(
+    return run_in_loop(
         train_core_async(
             domain=domain,
             config=config,
@@ -403,8 +396,7 @@ def train_nlu(
 
     """
 
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(
+    return run_in_loop(
         _train_nlu_async(
             config,
             nlu_data,
@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import os
 import shutil
 import warnings
 from types import TracebackType
-from typing import Any, Callable, Dict, List, Optional, Text, Type
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Text, Type, TypeVar
 
 import rasa.core.utils
 import rasa.utils.io
@@ -19,6 +20,8 @@ from rasa.constants import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class TempDirectoryPath(str):
     """Represents a path to an temporary directory. When used as a context
@@ -296,6 +299,41 @@ def lazy_property(function: Callable) -> Any:
     return _lazyprop
 
 
+def run_in_loop(
+    f: Coroutine[Any, Any, T], loop: Optional[asyncio.AbstractEventLoop] = None
+) -> T:
+    """Execute the coroutine `f` until it's done.
+
+    Args:
+        f: The coroutine which should be executed.
+        loop: The event loop which should be used. If `None`, the event loop of the
+            current thread is used. If the current thread doesn't have an event loop
+            (e.g. the threads of an executor), a new event loop is created and closed
+            once `f` is done. The event loop of the caller is never closed.
+
+    Returns:
+        The result of `f`.
+    """
+
+    if loop is not None:
+        return loop.run_until_complete(f)
+
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is not None:
+        return loop.run_until_complete(f)
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(f)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
 def raise_warning(
     message: Text,
     category: Optional[Type[Warning]] = None,
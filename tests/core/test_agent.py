@@ -2,6 +2,7 @@ import asyncio
 from typing import Text
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from sanic import Sanic, response
 
 import rasa.core
@@ -257,6 +258,24 @@ async def test_agent_update_model_none_domain(trained_rasa_model: Text):
     assert tracker.events[3].intent["name"] == "greet"
 
 
+async def test_load_agent_from_remote_storage(
+    trained_rasa_model: Text, monkeypatch: MonkeyPatch
+):
+    def load_from_remote_storage(remote_storage: Text, model_name: Text, **_):
+        assert remote_storage == "aws"
+        # the model download must not happen on the event loop
+        with pytest.raises(RuntimeError):
+            asyncio.get_event_loop()
+
+        return Agent.load_local_model(model_name)
+
+    monkeypatch.setattr(Agent, "load_from_remote_storage", load_from_remote_storage)
+
+    agent = await load_agent(model_path=trained_rasa_model, remote_storage="aws")
+
+    assert agent.model_directory is not None
+
+
 async def test_load_agent_on_not_existing_path():
     agent = await load_agent(model_path="some-random-path")
 
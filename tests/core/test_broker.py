@@ -1,8 +1,14 @@
+import asyncio
 import json
-from unittest.mock import patch
+from concurrent.futures import Future
+from typing import Dict, List
+from unittest.mock import Mock, patch
 
+import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
+import rasa.utils.io
+
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.brokers.file import FileEventBroker
 from rasa.core.brokers.kafka import KafkaEventBroker
@@ -47,6 +53,95 @@ def test_pika_message_property_app_id(monkeypatch: MonkeyPatch):
     assert pika_producer._get_message_properties().app_id == rasa_environment
 
 
+def _pika_broker_with_mocked_connection(
+    raise_on_failure: bool = True,
+) -> PikaEventBroker:
+    # patch PikaProducer so it doesn't try to connect to RabbitMQ on init
+    with patch.object(PikaEventBroker, "_run_pika", lambda _: None):
+        pika_producer = PikaEventBroker("", "", "", raise_on_failure=raise_on_failure)
+
+    pika_producer._pika_connection = Mock(is_closed=False)
+    # run the callbacks for the io loop thread right away
+    pika_producer._pika_connection.ioloop.add_callback_threadsafe.side_effect = (
+        lambda callback: callback()
+    )
+    pika_producer.channel = Mock()
+
+    return pika_producer
+
+
+def _published_events(pika_producer: PikaEventBroker) -> List[Dict]:
+    return [
+        json.loads(call[0][2])
+        for call in pika_producer.channel.basic_publish.call_args_list
+    ]
+
+
+def test_pika_broker_publishes_messages_in_io_loop_thread():
+    pika_producer = _pika_broker_with_mocked_connection()
+
+    pika_producer.publish({"event": "slot"})
+    pika_producer.publish({"event": "action"})
+
+    assert _published_events(pika_producer) == [{"event": "slot"}, {"event": "action"}]
+
+
+def test_pika_broker_publishes_messages_in_background():
+    pika_producer = _pika_broker_with_mocked_connection(raise_on_failure=False)
+    ioloop = pika_producer._pika_connection.ioloop
+    ioloop.add_callback_threadsafe.side_effect = None
+
+    pika_producer.publish({"event": "slot"})
+    pika_producer.publish({"event": "action"})
+
+    # the io loop thread is only woken up once for both messages
+    ioloop.add_callback_threadsafe.assert_called_once()
+    pika_producer.channel.basic_publish.assert_not_called()
+
+    callback = ioloop.add_callback_threadsafe.call_args[0][0]
+    callback()
+
+    assert _published_events(pika_producer) == [{"event": "slot"}, {"event": "action"}]
+
+
+# noinspection PyProtectedMember
+def test_pika_broker_keeps_messages_which_failed_in_background():
+    pika_producer = _pika_broker_with_mocked_connection(raise_on_failure=False)
+    pika_producer.channel.basic_publish.side_effect = ValueError()
+
+    pika_producer.publish({"event": "slot"})
+
+    assert list(pika_producer._unpublished_messages) == ['{"event": "slot"}']
+    assert pika_producer.channel is not None
+
+
+# noinspection PyProtectedMember
+def test_pika_broker_raises_errors_of_io_loop_thread():
+    pika_producer = _pika_broker_with_mocked_connection()
+    pika_producer.channel.basic_publish.side_effect = ValueError()
+
+    with pytest.raises(ValueError):
+        pika_producer.publish({"event": "slot"})
+
+    assert not pika_producer._is_publishing_scheduled
+
+
+# noinspection PyProtectedMember
+def test_pika_broker_publishes_scheduled_messages_before_closing():
+    pika_producer = _pika_broker_with_mocked_connection()
+    channel = pika_producer.channel
+
+    # message which another thread is waiting to be published
+    published = Future()
+    pika_producer._messages_to_publish.append(('{"event": "slot"}', None, published))
+
+    pika_producer.close()
+
+    assert published.done()
+    assert _published_events(pika_producer) == [{"event": "slot"}]
+    channel.close.assert_called_once()
+
+
 def test_no_broker_in_config():
     cfg = read_endpoint_config(DEFAULT_ENDPOINTS_FILE, "event_broker")
 
@@ -134,6 +229,86 @@ def test_file_broker_properly_logs_newlines(tmpdir):
     assert recovered == [event_with_newline]
 
 
+def test_file_broker_properly_logs_non_ascii_characters(tmpdir):
+    log_file_path = tmpdir.join("events.log").strpath
+
+    actual = EventBroker.create(
+        EndpointConfig(**{"type": "file", "path": log_file_path})
+    )
+
+    event = UserUttered("Grüße 👋")
+
+    actual.publish(event.as_dict())
+
+    with open(log_file_path, "r", encoding="utf-8") as log_file:
+        recovered = [Event.from_parameters(json.loads(line)) for line in log_file]
+
+    assert recovered == [event]
+
+
+async def test_file_broker_writes_events_of_loop_iteration_at_once(tmpdir):
+    log_file_path = tmpdir.join("events.log").strpath
+
+    actual = EventBroker.create(
+        EndpointConfig(**{"type": "file", "path": log_file_path})
+    )
+
+    for e in TEST_EVENTS:
+        actual.publish(e.as_dict())
+
+    # events are buffered until the event loop is idle again
+    assert rasa.utils.io.read_file(log_file_path) == ""
+
+    await asyncio.sleep(0)
+
+    recovered = []
+    with open(log_file_path, "r") as log_file:
+        for line in log_file:
+            recovered.append(Event.from_parameters(json.loads(line)))
+
+    assert recovered == TEST_EVENTS
+
+
+def test_file_broker_writes_events_after_event_loop_was_closed(tmpdir):
+    log_file_path = tmpdir.join("events.log").strpath
+
+    actual = EventBroker.create(
+        EndpointConfig(**{"type": "file", "path": log_file_path})
+    )
+
+    loop = asyncio.new_event_loop()
+    # the loop is closed before the scheduled flush runs
+    loop.call_soon(actual.publish, TEST_EVENTS[0].as_dict())
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+    loop.close()
+
+    actual.publish(TEST_EVENTS[1].as_dict())
+
+    with open(log_file_path, "r") as log_file:
+        recovered = [Event.from_parameters(json.loads(line)) for line in log_file]
+
+    assert recovered == TEST_EVENTS[:2]
+
+
+def test_file_brokers_append_to_same_file(tmpdir):
+    log_file_path = tmpdir.join("events.log").strpath
+
+    brokers = [
+        EventBroker.create(EndpointConfig(**{"type": "file", "path": log_file_path}))
+        for _ in range(2)
+    ]
+
+    for broker, event in zip(brokers, TEST_EVENTS):
+        broker.publish(event.as_dict())
+        broker.close()
+
+    with open(log_file_path, "r") as log_file:
+        recovered = [Event.from_parameters(json.loads(line)) for line in log_file]
+
+    assert recovered == TEST_EVENTS[:2]
+
+
 def test_load_custom_broker_name():
     config = EndpointConfig(**{"type": "rasa.core.brokers.file.FileEventBroker"})
     assert EventBroker.create(config)
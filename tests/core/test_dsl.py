@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 import json
@@ -10,7 +11,7 @@ import pytest
 
 import rasa.utils.io
 from rasa.core import training, utils
-from rasa.core.interpreter import RegexInterpreter
+from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.core.training.dsl import StoryFileReader, EndToEndReader
 from rasa.core.domain import Domain
 from rasa.core.trackers import DialogueStateTracker
@@ -367,6 +368,44 @@ async def test_read_stories_with_multiline_comments(tmpdir, default_domain):
     assert len(story_steps[3].events) == 2
 
 
+async def test_read_from_files_keeps_order_of_files(
+    tmpdir, default_domain, monkeypatch
+):
+    monkeypatch.setattr("rasa.core.training.dsl.MAX_CONCURRENTLY_READ_STORY_FILES", 2)
+
+    class SlowInterpreter(NaturalLanguageInterpreter):
+        def __init__(self):
+            self.running = 0
+            self.max_running = 0
+
+        async def parse(self, text, message_id=None, tracker=None):
+            self.running += 1
+            self.max_running = max(self.running, self.max_running)
+            # the files which are read first take the longest to parse
+            await asyncio.sleep(0.01 * (5 - int(text.split()[-1])))
+            self.running -= 1
+
+            return {
+                "text": text,
+                "intent": {"name": "greet", "confidence": 1.0},
+                "entities": [],
+            }
+
+    story_files = []
+    for i in range(5):
+        story_file = tmpdir.join(f"stories_{i}.md")
+        story_file.write(f"## story {i}\n* greet: hello {i}\n  - utter_greet\n")
+        story_files.append(story_file.strpath)
+
+    interpreter = SlowInterpreter()
+    story_steps = await StoryFileReader.read_from_files(
+        story_files, default_domain, interpreter, use_e2e=True
+    )
+
+    assert [step.block_name for step in story_steps] == [f"story {i}" for i in range(5)]
+    assert interpreter.max_running == 2
+
+
 @pytest.mark.parametrize(
     "line, expected",
     [
@@ -4,6 +4,7 @@ from aioresponses import aioresponses
 from rasa.core.interpreter import (
     INTENT_MESSAGE_PREFIX,
     RasaNLUHttpInterpreter,
+    RasaNLUInterpreter,
     RegexInterpreter,
 )
 from rasa.utils.endpoints import EndpointConfig
@@ -111,3 +112,19 @@ async def test_http_interpreter(endpoint_url, joined_url):
         response = {"text": "message_text", "token": None, "message_id": "message_id"}
 
         assert query == response
+
+
+def test_nlu_interpreters_share_component_builder(monkeypatch, tmpdir):
+    builders = []
+
+    def load(model_dir, component_builder=None):
+        builders.append(component_builder)
+
+    monkeypatch.setattr("rasa.nlu.model.Interpreter.load", load)
+
+    RasaNLUInterpreter(model_directory=tmpdir.strpath)
+    RasaNLUInterpreter(model_directory=tmpdir.strpath)
+
+    assert len(builders) == 2
+    assert builders[0] is not None
+    assert builders[0] is builders[1]
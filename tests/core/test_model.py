@@ -139,6 +139,31 @@ def test_persist_and_load_fingerprint():
     assert actual == fingerprint
 
 
+def test_load_changed_fingerprint():
+    from rasa.model import persist_fingerprint, fingerprint_from_path
+
+    output_directory = tempfile.mkdtemp()
+
+    persist_fingerprint(output_directory, _fingerprint())
+    fingerprint_from_path(output_directory)
+
+    changed_fingerprint = _fingerprint(config=["other", "config"])
+    persist_fingerprint(output_directory, changed_fingerprint)
+
+    assert fingerprint_from_path(output_directory) == changed_fingerprint
+
+
+def test_changing_loaded_fingerprint_does_not_change_cached_fingerprint():
+    from rasa.model import persist_fingerprint, fingerprint_from_path
+
+    output_directory = tempfile.mkdtemp()
+
+    persist_fingerprint(output_directory, _fingerprint(config=["test"]))
+    fingerprint_from_path(output_directory)[FINGERPRINT_CONFIG_KEY].append("other")
+
+    assert fingerprint_from_path(output_directory)[FINGERPRINT_CONFIG_KEY] == ["test"]
+
+
 @pytest.mark.parametrize(
     "fingerprint2, changed",
     [
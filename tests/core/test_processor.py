@@ -89,6 +89,22 @@ async def test_log_unseen_feature(default_processor: MessageProcessor):
     )
 
 
+async def test_log_unseen_features_skips_domain_check_for_known_features(
+    default_processor: MessageProcessor, monkeypatch: MonkeyPatch
+):
+    message = UserMessage('/greet{"name": "boy"}')
+    parsed = await default_processor._parse_message(message)
+
+    def is_empty() -> bool:
+        raise AssertionError("The domain shouldn't be checked for known features.")
+
+    monkeypatch.setattr(default_processor.domain, "is_empty", is_empty)
+
+    with pytest.warns(None) as record:
+        default_processor._log_unseen_features(parsed)
+    assert len(record) == 0
+
+
 @pytest.mark.parametrize("default_intent", DEFAULT_INTENTS)
 async def test_default_intent_recognized(
     default_processor: MessageProcessor, default_intent: Text
@@ -2,7 +2,12 @@ import pytest
 
 from typing import Tuple
 from rasa.nlu import registry
-from rasa.nlu.components import find_unavailable_packages
+from rasa.nlu.components import (
+    Component,
+    ComponentBuilder,
+    find_unavailable_packages,
+    validate_requirements,
+)
 from rasa.nlu.config import RasaNLUModelConfig
 from rasa.nlu.model import Metadata
 from tests.nlu import utilities
@@ -60,6 +65,24 @@ def test_find_unavailable_packages():
     assert unavailable == {"my_made_up_package_name", "foo_bar"}
 
 
+def test_validate_requirements_checks_every_package_once(monkeypatch):
+    checked_packages = []
+
+    def find_unavailable(package_names):
+        checked_packages.extend(package_names)
+        return set()
+
+    monkeypatch.setattr(
+        "rasa.nlu.components.find_unavailable_packages", find_unavailable
+    )
+
+    validate_requirements(
+        ["MitieNLP", "MitieTokenizer", "MitieIntentClassifier", "MitieTokenizer"]
+    )
+
+    assert sorted(checked_packages) == ["mitie"]
+
+
 def test_builder_create_by_module_path(component_builder, blank_config):
     from rasa.nlu.featurizers.sparse_featurizer.regex_featurizer import RegexFeaturizer
 
@@ -90,6 +113,29 @@ def test_create_component_exception_messages(
         component_builder.create_component(component_config, blank_config)
 
 
+class CachedComponent(Component):
+    @classmethod
+    def cache_key(cls, component_meta, model_metadata):
+        return component_meta["key"]
+
+
+def test_builder_evicts_least_recently_used_component(blank_config):
+    builder = ComponentBuilder(max_cache_size=2)
+    path = "tests.nlu.test_components.CachedComponent"
+
+    first = builder.create_component({"name": path, "key": "first"}, blank_config)
+    builder.create_component({"name": path, "key": "second"}, blank_config)
+
+    # using the first component again makes the second one the least recently used
+    assert (
+        builder.create_component({"name": path, "key": "first"}, blank_config) is first
+    )
+
+    builder.create_component({"name": path, "key": "third"}, blank_config)
+
+    assert list(builder.component_cache.keys()) == ["first", "third"]
+
+
 def test_builder_load_unknown(component_builder):
     with pytest.raises(Exception) as excinfo:
         component_meta = {"name": "my_made_up_componment"}
@@ -12,6 +12,15 @@ class Object:
     pass
 
 
+@pytest.fixture(autouse=True)
+def clear_persistor_cache():
+    yield
+
+    # persistors which were created by a test mustn't be reused by other tests
+    # noinspection PyProtectedMember
+    persistor._persistors.cache = {}
+
+
 # noinspection PyPep8Naming
 @mock_s3
 async def test_list_method_method_in_AWS_persistor(component_builder, tmpdir):
@@ -36,6 +45,32 @@ async def test_list_method_method_in_AWS_persistor(component_builder, tmpdir):
     assert len(result) == 1
 
 
+@mock_s3
+def test_get_persistor_reuses_persistor(monkeypatch):
+    monkeypatch.setenv("BUCKET_NAME", "rasa-test-reuse")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-west-1")
+
+    aws_persistor = persistor.get_persistor("aws")
+
+    assert isinstance(aws_persistor, persistor.AWSPersistor)
+    assert persistor.get_persistor("aws") is aws_persistor
+
+    monkeypatch.setenv("BUCKET_NAME", "rasa-test-reuse-other")
+
+    other_persistor = persistor.get_persistor("aws")
+
+    assert other_persistor is not aws_persistor
+    assert other_persistor.bucket_name == "rasa-test-reuse-other"
+
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+
+    assert persistor.get_persistor("aws") is not other_persistor
+
+
+def test_get_unknown_persistor():
+    assert persistor.get_persistor("unknown") is None
+
+
 # noinspection PyPep8Naming
 @mock_s3
 def test_list_models_method_raise_exeception_in_AWS_persistor():
@@ -10,6 +10,7 @@ from typing import List, Text, Type, Generator, NoReturn
 from contextlib import ExitStack
 
 from _pytest import pathlib
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 
 import pytest
@@ -19,6 +20,7 @@ from multiprocessing import Process, Manager
 
 import rasa
 import rasa.constants
+import rasa.server
 import rasa.utils.io
 from rasa.core import events, utils
 from rasa.core.agent import Agent
@@ -342,6 +344,16 @@ def test_parse_on_invalid_emulation_mode(rasa_app_nlu: SanicTestClient):
     assert response.status == 400
 
 
+@pytest.mark.parametrize("mode", ["WIT", "wit", "Wit"])
+def test_create_emulator_ignores_case_of_mode(mode: Text):
+    from rasa.nlu.emulators.wit import WitEmulator
+
+    # noinspection PyProtectedMember
+    emulator = rasa.server._create_emulator(mode)
+
+    assert type(emulator) is WitEmulator
+
+
 def test_train_stack_success(
     rasa_app,
     default_domain_path,
@@ -453,6 +465,38 @@ def test_train_internal_error(rasa_app: SanicTestClient):
     assert response.status == 500
 
 
+def test_job_executor_is_created_on_first_training(
+    rasa_app: SanicTestClient, monkeypatch: MonkeyPatch
+):
+    assert rasa_app.app.job_executor is None
+
+    executors = []
+
+    def train(*_, **__) -> None:
+        executors.append(rasa_app.app.job_executor)
+
+    monkeypatch.setattr(rasa, "train", train)
+
+    payload = dict(domain="domain data", config="config data", nlu="nlu data")
+    rasa_app.post("/model/train", json=payload)
+
+    assert len(executors) == 1
+    assert executors[0] is not None
+    # the test client stops the server after the request which shuts the executor down
+    assert rasa_app.app.job_executor is None
+
+
+def test_shutdown_job_executor(rasa_app: SanicTestClient):
+    app = rasa_app.app
+    executor = rasa.server._get_job_executor(app)
+
+    rasa.server._shutdown_job_executor(app)
+
+    assert app.job_executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
 def test_evaluate_stories(rasa_app, default_stories_file):
     stories = rasa.utils.io.read_file(default_stories_file)
 
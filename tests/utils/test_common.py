@@ -1,6 +1,13 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from rasa.utils.common import raise_warning, sort_list_of_dicts_by_first_key
+from rasa.utils.common import (
+    raise_warning,
+    run_in_loop,
+    sort_list_of_dicts_by_first_key,
+)
 
 
 def test_sort_dicts_by_keys():
@@ -27,3 +34,22 @@ def test_raise_deprecation():
     assert len(record) == 1
     assert record[0].message.args[0] == "My warning."
     assert isinstance(record[0].message, DeprecationWarning)
+
+
+async def _add(a: int, b: int) -> int:
+    await asyncio.sleep(0)
+    return a + b
+
+
+def test_run_in_loop_with_passed_loop():
+    loop = asyncio.new_event_loop()
+
+    assert run_in_loop(_add(1, 2), loop) == 3
+    assert not loop.is_closed()
+
+    loop.close()
+
+
+def test_run_in_loop_in_thread_without_event_loop():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(run_in_loop, _add(1, 2)).result() == 3